@@ -41,16 +41,18 @@ def demosaicing(img_raw: np.ndarray, code: ColorConversionCode = COLOR_PolarMono
 
     dtype = img_raw.dtype
 
-    if np.issubdtype(dtype, np.floating):
-        # If the dtype is floting type, the image is converted into `uint16` to apply demosaicing process.
-        # It may cause inaccurate result.
+    # Bilinear mono demosaicing is applied to `np.float32` or `np.float64` image directly.
+    # In the other cases, the floating type image is converted into `uint16` because OpenCV's Bayer demosaicing supports only `uint8` and `uint16`.
+    # It may cause inaccurate result.
+    is_float_supported = dtype in [np.float32, np.float64] and code == COLOR_PolarMono
+    if np.issubdtype(dtype, np.floating) and not is_float_supported:
         scale = 65535.0 / np.max(img_raw)
         img_raw_u16 = np.clip(img_raw * scale, 0, 65535).astype(np.uint16)
         img_demosaiced_u16 = demosaicing(img_raw_u16, code)
         img_demosaiced = (img_demosaiced_u16 / scale).astype(img_raw.dtype)
         return img_demosaiced
 
-    if dtype not in [np.uint8, np.uint16]:
+    if dtype not in [np.uint8, np.uint16] and not is_float_supported:
         raise TypeError(f"The dtype of input image must be `np.uint8` or `np.uint16`, not `{dtype}`")
 
     if img_raw.ndim != 2:
@@ -63,20 +65,99 @@ def demosaicing(img_raw: np.ndarray, code: ColorConversionCode = COLOR_PolarMono
 
 
 def __demosaicing_mono(img_mpfa: np.ndarray, suffix: str = "") -> List[np.ndarray]:
-    """Polarization demosaicing for np.uint8 or np.uint16 type"""
+    """Polarization demosaicing for np.uint8 or np.uint16 type (and np.float32 or np.float64 type for bilinear)"""
+    if suffix == "":
+        return __demosaicing_mono_bilinear(img_mpfa)
+
     code_bg = getattr(cv2, f"COLOR_BayerBG2BGR{suffix}")
     code_gr = getattr(cv2, f"COLOR_BayerGR2BGR{suffix}")
     img_debayer_bg = cv2.cvtColor(img_mpfa, code_bg)
     img_debayer_gr = cv2.cvtColor(img_mpfa, code_gr)
-    img_000, _, img_090 = cv2.split(img_debayer_bg)
-    img_045, _, img_135 = cv2.split(img_debayer_gr)
+    img_000 = cv2.extractChannel(img_debayer_bg, 0)
+    img_090 = cv2.extractChannel(img_debayer_bg, 2)
+    img_045 = cv2.extractChannel(img_debayer_gr, 0)
+    img_135 = cv2.extractChannel(img_debayer_gr, 2)
     return [img_000, img_045, img_090, img_135]
 
 
-def __demosaicing_color(img_cpfa: np.ndarray, suffix: str = "") -> List[np.ndarray]:
-    """Color-Polarization demosaicing for np.uint8 or np.uint16 type"""
+def __demosaicing_mono_bilinear(img_mpfa: np.ndarray) -> List[np.ndarray]:
+    """Bilinear polarization demosaicing
+
+    Each polarization angle is sampled on every other pixel, so each angle is a half-resolution sub-image.
+    The sub-images are upsampled individually, without running two full Bayer conversions and discarding their green channels.
+    """
+    height, width = img_mpfa.shape[:2]
+    img_demosaiced_list = []
+    for j, i in [(1, 1), (0, 1), (0, 0), (1, 0)]:  # 0, 45, 90, 135
+        img_demosaiced = __upsample_bilinear(img_mpfa[j::2, i::2], j, i, height, width)
+        img_demosaiced_list.append(img_demosaiced)
+    return img_demosaiced_list
+
+
+def __upsample_bilinear(img_sub: np.ndarray, j: int, i: int, height: int, width: int) -> np.ndarray:
+    """Bilinear upsampling ↑2 of the sub-image sampled at [j::2, i::2] to (height, width)
+
+    Nearest neighbor upsampling followed by 2x2 averaging gives the same result as bilinear interpolation.
+    Both steps are SIMD kernels of OpenCV. Averaging on the half-resolution grid and interleaving the four phases
+    into the output is slower, because the stride-2 writes cost more than the averaging saves.
+    """
+    # Pad to the half of even size by replicating the last sample
+    height_half = (height + 1) // 2
+    width_half = (width + 1) // 2
+    h, w = img_sub.shape[:2]
+    if (h, w) != (height_half, width_half):
+        img_sub = cv2.copyMakeBorder(img_sub, 0, height_half - h, 0, width_half - w, cv2.BORDER_REPLICATE)
+
+    img_nearest = cv2.resize(img_sub, (2 * width_half, 2 * height_half), interpolation=cv2.INTER_NEAREST)
+    img_bilinear = cv2.blur(img_nearest, (2, 2), anchor=(i, j), borderType=cv2.BORDER_REFLECT_101)
+    return img_bilinear[:height, :width]
+
+
+def __demosaicing_color(img_cpfa: np.ndarray, suffix: str = "", tile_size: int = 512, halo: int = 16) -> List[np.ndarray]:
+    """Color-Polarization demosaicing for np.uint8 or np.uint16 type
+
+    The image is processed tile by tile so that the intermediate images of both demosaicing steps stay in cache.
+    Each tile is extended by `halo` pixels to give the interpolations the same neighborhood as the whole image.
+    `tile_size` and `halo` must be multiples of 4 to keep the mosaic pattern of the tiles.
+    The tiles are processed serially. A thread pool over the tiles would oversubscribe the cores,
+    because `cv2.cvtColor`, `cv2.resize` and `cv2.blur` already run in parallel in OpenCV's own thread pool.
+    """
+    height, width = img_cpfa.shape[:2]
+
+    img_bgr_list = [np.empty((height, width, 3), dtype=img_cpfa.dtype) for _ in range(4)]
+    for y0 in range(0, height, tile_size):
+        for x0 in range(0, width, tile_size):
+            y1 = min(y0 + tile_size, height)
+            x1 = min(x0 + tile_size, width)
+
+            # Tile with halo
+            y0_halo = max(y0 - halo, 0)
+            x0_halo = max(x0 - halo, 0)
+            y1_halo = min(y1 + halo, height)
+            x1_halo = min(x1 + halo, width)
+            img_tile_list = __demosaicing_color_tile(img_cpfa[y0_halo:y1_halo, x0_halo:x1_halo], suffix)
+
+            for img_bgr, img_tile in zip(img_bgr_list, img_tile_list):
+                img_bgr[y0:y1, x0:x1] = img_tile[y0 - y0_halo : y1 - y0_halo, x0 - x0_halo : x1 - x0_halo]
+
+    return img_bgr_list
+
+
+def __demosaicing_color_tile(img_cpfa: np.ndarray, suffix: str = "") -> List[np.ndarray]:
+    """Color-Polarization demosaicing of a single tile"""
     height, width = img_cpfa.shape[:2]
 
+    if suffix == "":
+        # Each color demosaiced sub-image is upsampled directly to the image of its polarization angle,
+        # so the full resolution color MPFA image is not needed.
+        code = cv2.COLOR_BayerBG2BGR
+        img_bgr_list = []
+        for j, i in [(1, 1), (0, 1), (0, 0), (1, 0)]:  # 0, 45, 90, 135
+            img_bgr_ij = cv2.cvtColor(img_cpfa[j::2, i::2], code)
+            img_bgr = __upsample_bilinear(img_bgr_ij, j, i, height, width)
+            img_bgr_list.append(img_bgr)
+        return img_bgr_list
+
     # 1. Color demosaicing process
     img_mpfa_bgr = np.empty((height, width, 3), dtype=img_cpfa.dtype)
     code = getattr(cv2, f"COLOR_BayerBG2BGR{suffix}")
@@ -98,7 +179,8 @@ def __demosaicing_color(img_cpfa: np.ndarray, suffix: str = "") -> List[np.ndarr
     img_bgr_045 = np.empty((height, width, 3), dtype=img_mpfa_bgr.dtype)
     img_bgr_090 = np.empty((height, width, 3), dtype=img_mpfa_bgr.dtype)
     img_bgr_135 = np.empty((height, width, 3), dtype=img_mpfa_bgr.dtype)
-    for i, img_mpfa in enumerate(cv2.split(img_mpfa_bgr)):
+    for i in range(3):
+        img_mpfa = cv2.extractChannel(img_mpfa_bgr, i)
         img_000, img_045, img_090, img_135 = __demosaicing_mono(img_mpfa, suffix)
         img_bgr_000[..., i] = img_000
         img_bgr_045[..., i] = img_045
@@ -1,8 +1,35 @@
-from typing import List
+import functools
+from typing import List, Optional, Sequence, Tuple, Union
 import numpy as np
+import cv2
 from .mueller import polarizer
 
 
+@functools.lru_cache(maxsize=32)
+def _pinv_cached(A_bytes: bytes, shape: Tuple[int, ...], dtype: str) -> np.ndarray:
+    A = np.frombuffer(A_bytes, dtype=dtype).reshape(shape)
+
+    # QR decomposition is cheaper than SVD when A has full column rank,
+    # otherwise fall back to the SVD-based pseudo-inverse.
+    A_pinv = None
+    if A.shape[0] >= A.shape[1]:
+        Q, R = np.linalg.qr(A)
+        diag = np.abs(np.diag(R))
+        if diag.min() > diag.max() * max(A.shape) * np.finfo(R.dtype).eps:
+            A_pinv = np.linalg.solve(R, Q.T)
+    if A_pinv is None:
+        A_pinv = np.linalg.pinv(A)
+
+    A_pinv.flags.writeable = False
+    return A_pinv
+
+
+def _pinv(A: np.ndarray) -> np.ndarray:
+    """Pseudo-inverse of the observation matrix. The result is cached because the same matrix is often reused (e.g., video frames)"""
+    A = np.ascontiguousarray(A)
+    return _pinv_cached(A.tobytes(), A.shape, A.dtype.str)
+
+
 def calcStokes(intensity_list: List[np.ndarray], mueller_list: List[np.ndarray]) -> np.ndarray:
     """Calculate stokes parameters from measured intensities and mueller matrices
 
@@ -16,7 +43,7 @@ def calcStokes(intensity_list: List[np.ndarray], mueller_list: List[np.ndarray])
     Returns
     -------
     stokes : np.ndarray
-        Calculated stokes parameters
+        Calculated stokes parameters. The dtype is `np.float64` for `np.float64` intensities, otherwise `np.float32`
 
     Examples
     --------
@@ -68,14 +95,26 @@ def calcStokes(intensity_list: List[np.ndarray], mueller_list: List[np.ndarray])
         return calcLinearStokes(intensities, polarizer_angles)
 
     # Move the axis of the number of elements to the last axis
-    intensities = np.moveaxis(intensities, 0, -1)  # (*, len)
     muellers = np.moveaxis(muellers, 0, -1)  # (*, len)
 
     # Calculate
     A = muellers[0].T  # [m11, m12, m13] (len, 3) or [m11, m12, m13, m14] (len, 4)
-    A_pinv = np.linalg.pinv(A)  # (3, len) or (len, 4)
-    stokes = np.tensordot(A_pinv, intensities, axes=(1, -1))  # (3, *) or (4, *)
-    stokes = np.moveaxis(stokes, 0, -1)  # (*, 3) or (*, 4)
+    A_pinv = _pinv(A)  # (3, len) or (4, len)
+    return _solve_stokes(intensities, A_pinv)
+
+
+def _solve_stokes(intensities: np.ndarray, A_pinv: np.ndarray) -> np.ndarray:
+    """Apply the pseudo-inverse of the observation matrix (3, len) or (4, len) to the intensities (len, *)
+
+    The stokes parameters are calculated in `np.float64` for `np.float64` intensities, otherwise in `np.float32` (e.g., `np.uint8` and `np.uint16` images).
+    Both the intensities and the pseudo-inverse are cast, so that the product is a single-precision BLAS call without promotion to `np.float64`.
+    """
+    dtype = intensities.dtype if intensities.dtype in (np.float32, np.float64) else np.dtype(np.float32)
+    A_pinv = A_pinv.astype(dtype, copy=False)
+    shape = intensities.shape[1:]
+    intensities_flat = np.reshape(intensities, (len(intensities), -1)).astype(dtype, copy=False)  # (len, N)
+    stokes = np.dot(intensities_flat.T, A_pinv.T)  # (N, 3) or (N, 4), a single matrix product without transposing the output
+    stokes = np.reshape(stokes, (*shape, -1))  # (*, 3) or (*, 4)
     return stokes
 
 
@@ -92,190 +131,415 @@ def calcLinearStokes(intensities: List[np.ndarray], polarizer_angles: List[float
     Returns
     -------
     stokes : np.ndarray
-        Calculated stokes parameters
+        Calculated stokes parameters. The dtype is `np.float64` for `np.float64` intensities, otherwise `np.float32`
     """
-    muellers = [polarizer(angle)[:3, :3] for angle in polarizer_angles]
-    return calcStokes(intensities, muellers)
+    A_pinv = _pinv_polarizer_angles(polarizer_angles)  # (3, len)
+
+    intensities = np.array(intensities)  # (len, *)
+    len_intensities = len(intensities)
+    len_polarizer_angles = len(polarizer_angles)
+    if len_intensities != len_polarizer_angles:
+        raise ValueError(f"The number of elements must be same, not {len_intensities} != {len_polarizer_angles}.")
+
+    return _solve_stokes(intensities, A_pinv)
+
+
+def _pinv_polarizer_angles(polarizer_angles: List[float]) -> np.ndarray:
+    """Pseudo-inverse of the observation matrix for the linear polarizer angles. The result is cached by the angles"""
+    theta = np.ascontiguousarray(polarizer_angles, dtype=np.float64)
+    return _pinv_polarizer_angles_cached(theta.tobytes())
+
+
+@functools.lru_cache(maxsize=32)
+def _pinv_polarizer_angles_cached(theta_bytes: bytes) -> np.ndarray:
+    theta = np.frombuffer(theta_bytes, dtype=np.float64)
+    A_pinv = _pinv_symmetric_polarizer_angles(theta)
+    if A_pinv is None:
+        A = np.array([polarizer(angle)[0, :3] for angle in theta])  # [m11, m12, m13] (len, 3)
+        A_pinv = _pinv(A)
+    A_pinv.flags.writeable = False
+    return A_pinv
+
+
+def _pinv_symmetric_polarizer_angles(polarizer_angles: List[float]) -> Optional[np.ndarray]:
+    """Closed-form pseudo-inverse for the common sets of linear polarizer angles, or None for the other sets
 
+    The rows of the observation matrix A are 0.5 * [1, cos(2θ), sin(2θ)].
+    If the angles are evenly spaced over [0, pi) in any order (e.g., 0, 45, 90, 135 degrees or 0, 60, 120 degrees),
+    the sums of cos(2θ), sin(2θ), cos(4θ) and sin(4θ) are 0, so A^T A = diag(N/4, N/8, N/8)
+    and the pseudo-inverse is [2/N, 4cos(2θ)/N, 4sin(2θ)/N] without any decomposition.
+    """
+    theta = np.asarray(polarizer_angles, dtype=np.float64)
+    if theta.ndim != 1 or len(theta) < 3:
+        return None
+
+    n = len(theta)
+    c = np.cos(2 * theta)
+    s = np.sin(2 * theta)
+    sums = [np.sum(c), np.sum(s), np.sum(c * c - s * s), np.sum(2 * c * s)]  # cos(2θ), sin(2θ), cos(4θ), sin(4θ)
+    if not np.allclose(sums, 0, atol=1e-9):
+        return None
+
+    return np.stack([np.full(n, 2 / n), 4 * c / n, 4 * s / n])  # (3, len)
+
+
+def _split_stokes(stokes: Union[np.ndarray, Sequence[np.ndarray]]) -> List[np.ndarray]:
+    """Split stokes parameters into the list of its components
+
+    `stokes` is either an array whose last axis is the components, (*, 3) or (*, 4),
+    or a sequence of the components (s0, s1, s2[, s3]) such as the output of `cv2.split`.
+    The components of an array are strided views, while separated components are contiguous and faster to process.
+    """
+    if isinstance(stokes, np.ndarray):
+        return [stokes[..., i] for i in range(stokes.shape[-1])]
+    return [np.asarray(s) for s in stokes]
+
+
+def _is_cv2_image_pair(x: np.ndarray, y: np.ndarray) -> bool:
+    """Whether the pair of components can be processed by OpenCV's multi-threaded SIMD kernels (2D or more, the same shape and float dtype, and contiguous rows)
+
+    OpenCV copies strided inputs (e.g., stokes[..., 1]), which costs more than the faster kernel saves.
+    """
+    is_same_float = x.ndim >= 2 and x.shape == y.shape and x.dtype == y.dtype and x.dtype in (np.float32, np.float64)
+    return is_same_float and x.strides[-1] == x.itemsize and y.strides[-1] == y.itemsize
+
+
+def _as_2d(x: np.ndarray) -> np.ndarray:
+    """Merge the leading axes for OpenCV (e.g., a stack of images (frames, height, width) to (frames * height, width)). It is a view in most cases"""
+    return x.reshape(-1, x.shape[-1])
+
+
+def _out_for(out: Optional[np.ndarray], *components: np.ndarray) -> Optional[np.ndarray]:
+    """`out` if the result of the components can be computed in it directly (the same shape and dtype as the result), otherwise None
+
+    For any other `out`, the result is computed in a temporary array and copied by `_copy_to`,
+    so the kernel and the precision depend only on the inputs, not on the destination array.
+    """
+    if out is None:
+        return None
+    shape = np.broadcast_shapes(*[np.shape(c) for c in components])
+    dtype = np.result_type(*components, np.float16)  # the floating type of the result
+    return out if out.shape == shape and out.dtype == dtype else None
+
+
+def _is_cv2_dst(out: Optional[np.ndarray], x: np.ndarray) -> bool:
+    """Whether OpenCV can write the result of `x` directly into `out` (a C-contiguous array of the same shape and dtype as `x`)"""
+    return isinstance(out, np.ndarray) and out.shape == x.shape and out.dtype == x.dtype and out.flags.c_contiguous
+
+
+def _copy_to(out: Optional[np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Copy `x` into `out` and return it. If `out` is None or already `x`, `x` is returned as is"""
+    if out is None or out is x:
+        return x
+    np.copyto(out, x)
+    return out
+
+
+def _linear_magnitude(s1: np.ndarray, s2: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Magnitude of the linear polarization component, sqrt(s1^2 + s2^2). `out` must have the dtype of the result (see `_out_for`)"""
+    if _is_cv2_image_pair(s1, s2):
+        if _is_cv2_dst(out, s1):
+            cv2.magnitude(_as_2d(s1), _as_2d(s2), _as_2d(out))  # written through the view of `out`
+            return out
+        return _copy_to(out, cv2.magnitude(_as_2d(s1), _as_2d(s2)).reshape(s1.shape))
+    magnitude = np.asarray(np.square(s1, out=out))
+    magnitude += np.square(s2)
+    return np.sqrt(magnitude, out=magnitude)
+
+
+def _divide_by_s0(x: np.ndarray, s0: np.ndarray) -> np.ndarray:
+    """Divide `x` by s0 in place. The pixels where s0 is 0 are set to 0 instead of nan or inf"""
+    x = np.asarray(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(x, s0, out=x)
+    # Checking the contiguous result is cheaper than reading the (often strided) s0 again, so the mask is made only if needed
+    if not np.isfinite(x).all():
+        x[s0 == 0] = 0
+    return x
+
+
+def _aolp(s1: np.ndarray, s2: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """AoLP, 0.5 * atan2(s2, s1) wrapped into [0, pi]. `out` must have the dtype of the result (see `_out_for`)
+
+    For `np.float32` images (or stack of them), OpenCV's vectorized atan2 approximation (`cv2.phase`, error is about 0.01 degrees) is used instead of `np.arctan2`.
+    `np.float64` images keep the exact `np.arctan2`, because the approximation is float precision regardless of the dtype.
+    """
+    if _is_cv2_image_pair(s1, s2) and s1.dtype == np.float32:
+        if _is_cv2_dst(out, s1):
+            aolp = out
+            cv2.phase(_as_2d(s1), _as_2d(s2), angle=_as_2d(out))  # written through the view of `out`
+        else:
+            aolp = _copy_to(out, cv2.phase(_as_2d(s1), _as_2d(s2)).reshape(s1.shape))  # [0, 2pi)
+        aolp *= 0.5
+        return aolp
 
-def cvtStokesToImax(stokes: np.ndarray) -> np.ndarray:
+    aolp = np.asarray(np.arctan2(s2, s1, out=out))
+    aolp *= 0.5  # [-pi/2, pi/2]
+    np.add(aolp, np.pi, out=aolp, where=(aolp < 0))  # same as np.mod(aolp, np.pi) for this range
+    return aolp
+
+
+def cvtStokesToAll(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[Sequence[Optional[np.ndarray]]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Convert stokes parameters to intensity, DoLP, AoLP, Imax and Imin at once
+
+    The linear polarization magnitude is computed only once and shared by all outputs,
+    which is faster than calling each `cvtStokesTo*` function separately.
+
+    Parameters
+    ----------
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : Sequence[Optional[np.ndarray]], optional
+        Arrays to write the results into, (intensity, DoLP, AoLP, i_max, i_min), by default None (new arrays are allocated).
+        Each of them can be None to allocate only that output. Reusing the arrays across frames avoids allocating five images per frame
+
+    Returns
+    -------
+    intensity : np.ndarray
+        Intensity (same as s0 component)
+    DoLP : np.ndarray
+        DoLP ∈ [0, 1] (0 where s0 is 0)
+    AoLP : np.ndarray
+        AoLP ∈ [0, np.pi]
+    i_max : np.ndarray
+        Imax
+    i_min : np.ndarray
+        Imin
+
+    Examples
+    --------
+    >>> img_intensity, img_dolp, img_aolp, img_max, img_min = pa.cvtStokesToAll(img_stokes)
+
+    Convert a batch of frames (e.g., video) in one call, stacked on a leading axis
+
+    >>> video_stokes.shape
+    (30, 2048, 2448, 3)
+    >>> video_intensity, video_dolp, video_aolp, video_max, video_min = pa.cvtStokesToAll(video_stokes)
+    >>> video_dolp.shape
+    (30, 2048, 2448)
+
+    Write the results into preallocated arrays
+
+    >>> buffers = [np.empty(img_stokes.shape[:-1], dtype=img_stokes.dtype) for _ in range(5)]
+    >>> img_intensity, img_dolp, img_aolp, img_max, img_min = pa.cvtStokesToAll(img_stokes, out=buffers)
+    """
+    if out is None:
+        out = [None] * 5
+    if len(out) != 5:
+        raise ValueError(f"'out' must be a sequence of 5 arrays (intensity, DoLP, AoLP, i_max, i_min), not {len(out)}")
+    out_intensity, out_dolp, out_aolp, out_max, out_min = out
+
+    s0, s1, s2 = _split_stokes(stokes)[:3]
+    magnitude = _linear_magnitude(s1, s2, out=_out_for(out_dolp, s0, s1, s2))
+    intensity = _copy_to(out_intensity, s0)
+    aolp = _copy_to(out_aolp, _aolp(s1, s2, out=_out_for(out_aolp, s1, s2)))
+    i_max = np.add(s0, magnitude, out=_out_for(out_max, s0, s1, s2))
+    i_max *= 0.5
+    i_min = np.subtract(s0, magnitude, out=_out_for(out_min, s0, s1, s2))
+    i_min *= 0.5
+    dolp = _divide_by_s0(magnitude, s0)  # reuse the buffer of magnitude
+    return intensity, _copy_to(out_dolp, dolp), aolp, _copy_to(out_max, i_max), _copy_to(out_min, i_min)
+
+
+def cvtStokesToImax(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to Imax (maximum value when rotating the linear polarizer)
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     i_max : np.ndarray
         Imax
     """
-    s0 = stokes[..., 0]
-    s1 = stokes[..., 1]
-    s2 = stokes[..., 2]
-    return (s0 + np.sqrt(s1**2 + s2**2)) * 0.5
+    s0, s1, s2 = _split_stokes(stokes)[:3]
+    i_max = _linear_magnitude(s1, s2, out=_out_for(out, s0, s1, s2))
+    i_max += s0
+    i_max *= 0.5
+    return _copy_to(out, i_max)
 
 
-def cvtStokesToImin(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToImin(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to Imin (minimum value when rotating the linear polarizer)
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     i_min : np.ndarray
         Imin
     """
-    s0 = stokes[..., 0]
-    s1 = stokes[..., 1]
-    s2 = stokes[..., 2]
-    return (s0 - np.sqrt(s1**2 + s2**2)) * 0.5
+    s0, s1, s2 = _split_stokes(stokes)[:3]
+    dst = _out_for(out, s0, s1, s2)
+    i_min = np.subtract(s0, _linear_magnitude(s1, s2, out=dst), out=dst)
+    i_min *= 0.5
+    return _copy_to(out, i_min)
 
 
-def cvtStokesToDoLP(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToDoLP(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to DoLP (Degree of Linear Polarization)
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     DoLP : np.ndarray
-        DoLP ∈ [0, 1]
+        DoLP ∈ [0, 1] (0 where s0 is 0)
     """
-    s0 = stokes[..., 0]
-    s1 = stokes[..., 1]
-    s2 = stokes[..., 2]
-    return np.sqrt(s1**2 + s2**2) / s0
+    s0, s1, s2 = _split_stokes(stokes)[:3]
+    dolp = _divide_by_s0(_linear_magnitude(s1, s2, out=_out_for(out, s0, s1, s2)), s0)
+    return _copy_to(out, dolp)
 
 
-def cvtStokesToAoLP(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToAoLP(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to AoLP (Angle of Linear Polarization)
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     AoLP : np.ndarray
         AoLP ∈ [0, np.pi]
     """
-    s1 = stokes[..., 1]
-    s2 = stokes[..., 2]
-    return np.mod(0.5 * np.arctan2(s2, s1), np.pi)
+    _, s1, s2 = _split_stokes(stokes)[:3]
+    return _copy_to(out, _aolp(s1, s2, out=_out_for(out, s1, s2)))
 
 
-def cvtStokesToIntensity(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToIntensity(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to intensity (same as s0 component)
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     intensity : np.ndarray
         Intensity
     """
-    s0 = stokes[..., 0]
-    return s0
+    s0 = _split_stokes(stokes)[0]
+    return _copy_to(out, s0)
 
 
-def cvtStokesToDiffuse(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToDiffuse(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to diffuse
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
+
     Returns
     -------
     diffuse : np.ndarray
         Diffuse
     """
-    Imin = cvtStokesToImin(stokes)
+    Imin = cvtStokesToImin(stokes, out=out)
     return Imin
 
 
-def cvtStokesToSpecular(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToSpecular(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to specular
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     specular : np.ndarray
         Specular
     """
-    s1 = stokes[..., 1]
-    s2 = stokes[..., 2]
-    return np.sqrt(s1**2 + s2**2)  # same as Imax - Imin
+    _, s1, s2 = _split_stokes(stokes)[:3]
+    return _copy_to(out, _linear_magnitude(s1, s2, out=_out_for(out, s1, s2)))  # same as Imax - Imin
 
 
-def cvtStokesToDoP(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToDoP(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to DoP (Degree of Polarization)
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     DoP : np.ndarray
-        DoP ∈ [0, 1]
+        DoP ∈ [0, 1] (0 where s0 is 0)
     """
-    s0 = stokes[..., 0]
-    s1 = stokes[..., 1]
-    s2 = stokes[..., 2]
-    s3 = stokes[..., 3]
-    return np.sqrt(s1**2 + s2**2 + s3**2) / s0
+    s0, s1, s2, s3 = _split_stokes(stokes)[:4]
+    dst = _out_for(out, s0, s1, s2, s3)
+    magnitude = np.asarray(np.square(s1, out=dst))
+    magnitude += np.square(s2)
+    magnitude += np.square(s3)
+    dop = _divide_by_s0(np.sqrt(magnitude, out=magnitude), s0)
+    return _copy_to(out, dop)
 
 
-def cvtStokesToEllipticityAngle(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToEllipticityAngle(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to ellipticity angle
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     EllipticityAngle : np.ndarray
         ellipticity angle ∈ [-pi/4, pi/4]
     """
-    s1 = stokes[..., 1]
-    s2 = stokes[..., 2]
-    s3 = stokes[..., 3]
-    return 0.5 * np.arctan2(s3, np.sqrt(s1**2 + s2**2))
+    _, s1, s2, s3 = _split_stokes(stokes)[:4]
+    ellipticity_angle = np.arctan2(s3, _linear_magnitude(s1, s2), out=_out_for(out, s1, s2, s3))
+    ellipticity_angle *= 0.5
+    return _copy_to(out, ellipticity_angle)
 
 
-def cvtStokesToDoCP(stokes: np.ndarray) -> np.ndarray:
+def cvtStokesToDoCP(stokes: Union[np.ndarray, Sequence[np.ndarray]], out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert stokes parameters to DoCP (Degree of Circular Polarization)
 
     Parameters
     ----------
-    stokes : np.ndarray
-        Stokes parameters
+    stokes : Union[np.ndarray, Sequence[np.ndarray]]
+        Stokes parameters, (*, 3) or (*, 4), or its components (s0, s1, s2[, s3])
+    out : np.ndarray, optional
+        Array to write the result into, by default None (a new array is allocated). Its shape must be the shape of the stokes parameters without the last axis
 
     Returns
     -------
     DoCP : np.ndarray
         DoCP ∈ [-1, 1]
     """
-    s0 = stokes[..., 0]
-    s3 = stokes[..., 3]
-    return s3 / s0
+    s0, _, _, s3 = _split_stokes(stokes)[:4]
+    return _copy_to(out, np.divide(s3, s0, out=_out_for(out, s0, s3)))
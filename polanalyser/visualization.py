@@ -1,10 +1,15 @@
+import sys
 from typing import Union, Optional
 import numpy as np
 import cv2
-import matplotlib
 
-import matplotlib.pyplot as plt
-from mpl_toolkits.axes_grid1 import ImageGrid
+# matplotlib is imported in the functions that use it, because importing it takes most of the time of `import polanalyser`.
+
+
+def _is_matplotlib_colormap(obj) -> bool:
+    # A Colormap object can only exist if matplotlib has been imported by the caller
+    matplotlib = sys.modules.get("matplotlib")
+    return matplotlib is not None and isinstance(obj, matplotlib.colors.Colormap)
 
 
 def applyColorMap(x: np.ndarray, colormap: Union[str, np.ndarray], vmin: float = 0.0, vmax: float = 255.0) -> np.ndarray:
@@ -51,16 +56,18 @@ def applyColorMap(x: np.ndarray, colormap: Union[str, np.ndarray], vmin: float =
     x_normalized_u8 = (255 * x_normalized).astype(np.uint8)  # [0, 255]
 
     # Get colormap
-    if isinstance(colormap, (str, matplotlib.colors.Colormap)):
+    if isinstance(colormap, np.ndarray) and colormap.shape == (256, 3) and colormap.dtype == np.uint8:
+        # from user defined array
+        lut_u8 = colormap
+    elif isinstance(colormap, str) or _is_matplotlib_colormap(colormap):
         # from matplotlib
+        import matplotlib.cm
+
         cmap = matplotlib.cm.get_cmap(colormap, 256)
         lut = cmap(range(256))  # [0.0, 1.0], (256, 4), np.float64, RGBA
         lut = lut[:, :3]  # [0.0, 1.0], (256, 3), np.float64, RGB
         lut = lut[:, ::-1]  # [0.0, 1.0], (256, 3), np.float64, BGR
         lut_u8 = np.clip(255 * lut, 0, 255).astype(np.uint8)  # [0, 255], (256, 3), np.uint8, BGR
-    elif isinstance(colormap, np.ndarray) and colormap.shape == (256, 3) and colormap.dtype == np.uint8:
-        # from user defined array
-        lut_u8 = colormap
     else:
         raise TypeError(f"'colormap' must be 'str' or 'np.ndarray ((256, 3), np.uint8)'.")
 
@@ -69,6 +76,19 @@ def applyColorMap(x: np.ndarray, colormap: Union[str, np.ndarray], vmin: float =
     return x_colored
 
 
+def _scale_to_u8(x: Union[float, np.ndarray], shape) -> np.ndarray:
+    """Scale value(s) in [0.0, 1.0] to np.uint8 image in [0, 255] with the given shape"""
+    if np.ndim(x) == 0:
+        return np.full(shape, int(np.clip(x * 255, 0, 255)), dtype=np.uint8)
+
+    x_scaled = np.multiply(x, 255.0)
+    np.clip(x_scaled, 0, 255, out=x_scaled)
+    x_u8 = x_scaled.astype(np.uint8)
+    if x_u8.shape != shape:
+        x_u8 = np.ascontiguousarray(np.broadcast_to(x_u8, shape))
+    return x_u8
+
+
 def applyColorToAoLP(aolp: np.ndarray, saturation: Union[float, np.ndarray] = 1.0, value: Union[float, np.ndarray] = 1.0) -> np.ndarray:
     """Apply colormap to AoLP. The colormap is based on HSV.
 
@@ -86,11 +106,21 @@ def applyColorToAoLP(aolp: np.ndarray, saturation: Union[float, np.ndarray] = 1.
     aolp_colored : np.ndarray
         An applied colormap to AoLP, its shape is (height, width, 3) and dtype is `np.uint8`
     """
-    ones = np.ones_like(aolp)
-
-    hue = (np.mod(aolp, np.pi) / np.pi * 179).astype(np.uint8)  # [0, pi] to [0, 179]
-    saturation = np.clip(ones * saturation * 255, 0, 255).astype(np.uint8)
-    value = np.clip(ones * value * 255, 0, 255).astype(np.uint8)
+    hue = np.mod(aolp, np.pi)
+    hue *= 179 / np.pi
+    hue = hue.astype(np.uint8)  # [0, pi] to [0, 179]
+
+    if np.ndim(saturation) == 0 and np.ndim(value) == 0:
+        # The color depends only on the hue, so convert the 180 hues to BGR once and look them up
+        lut_hsv = np.empty((1, 256, 3), dtype=np.uint8)
+        lut_hsv[..., 0] = np.clip(np.arange(256), 0, 179)
+        lut_hsv[..., 1] = _scale_to_u8(saturation, ())
+        lut_hsv[..., 2] = _scale_to_u8(value, ())
+        lut_bgr = cv2.cvtColor(lut_hsv, cv2.COLOR_HSV2BGR)  # (1, 256, 3)
+        return cv2.LUT(cv2.cvtColor(hue, cv2.COLOR_GRAY2BGR), lut_bgr)
+
+    saturation = _scale_to_u8(saturation, aolp.shape)
+    value = _scale_to_u8(value, aolp.shape)
 
     hsv = cv2.merge([hue, saturation, value])
     aolp_colored = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
@@ -113,6 +143,9 @@ def plotMueller(filename: str, img_mueller: np.ndarray, vabsmax: Optional[float]
     cmap : str
         Color map for plot.
     """
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.axes_grid1 import ImageGrid
+
     # Check
     ndim = img_mueller.ndim
     _height, _width, n1, n2 = img_mueller.shape